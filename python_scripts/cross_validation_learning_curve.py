@@ -64,11 +64,12 @@ train_sizes
 
 # %% [markdown]
 # We will use a `ShuffleSplit` cross-validation to assess our predictive model.
+# We use the same splits as in the validation curve notebook.
 
 # %%
 from sklearn.model_selection import ShuffleSplit
 
-cv = ShuffleSplit(n_splits=30, test_size=0.2)
+cv = ShuffleSplit(n_splits=30, test_size=0.2, random_state=0)
 
 # %% [markdown]
 # Now, we are all set to carry out the experiment.
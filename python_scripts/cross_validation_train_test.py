@@ -207,7 +207,12 @@ from sklearn.model_selection import ShuffleSplit
 
 cv = ShuffleSplit(n_splits=40, test_size=0.3, random_state=0)
 cv_results = cross_validate(
-    regressor, data, target, cv=cv, scoring="neg_mean_absolute_error"
+    regressor,
+    data,
+    target,
+    cv=cv,
+    scoring="neg_mean_absolute_error",
+    n_jobs=2,
 )
 
 # %% [markdown]
@@ -339,7 +344,9 @@ print(f"The standard deviation of the target is: {target.std():.2f} k$")
 # passing the option `return_estimator=True` in `cross_validate`.
 
 # %%
-cv_results = cross_validate(regressor, data, target, return_estimator=True)
+cv_results = cross_validate(
+    regressor, data, target, return_estimator=True, n_jobs=2
+)
 cv_results
 
 # %%
@@ -359,7 +366,7 @@ cv_results["estimator"]
 # %%
 from sklearn.model_selection import cross_val_score
 
-scores = cross_val_score(regressor, data, target)
+scores = cross_val_score(regressor, data, target, n_jobs=2)
 scores
 
 # %% [markdown]
@@ -100,11 +100,7 @@ def bootstrap_sample(data, target, seed=0):
     # Indices corresponding to a sampling with replacement of the same sample
     # size than the original data
     rng = np.random.default_rng(seed)
-    bootstrap_indices = rng.choice(
-        np.arange(target.shape[0]),
-        size=target.shape[0],
-        replace=True,
-    )
+    bootstrap_indices = rng.integers(0, target.shape[0], size=target.shape[0])
     # In pandas, we need to use `.iloc` to extract rows using an integer
     # position index:
     data_bootstrap = data.iloc[bootstrap_indices]
@@ -166,8 +162,10 @@ data_bootstrap_sample, target_bootstrap_sample = bootstrap_sample(
     data_train_huge, target_train_huge
 )
 
+# the resampled rows keep their index from the original dataset: counting the
+# unique index values avoids comparing floating point feature values
 ratio_unique_sample = (
-    np.unique(data_bootstrap_sample).size / data_bootstrap_sample.size
+    data_bootstrap_sample.index.nunique() / data_bootstrap_sample.shape[0]
 )
 print(
     "Percentage of samples present in the original dataset: "
@@ -206,11 +204,13 @@ for bootstrap_idx in range(n_bootstraps):
 sns.scatterplot(
     x=data_train["Feature"], y=target_train, color="black", alpha=0.5
 )
+# store the predictions of each tree in a row of a 2D array
+bag_predictions = np.empty((len(bag_of_trees), len(data_test)))
 for tree_idx, tree in enumerate(bag_of_trees):
-    tree_predictions = tree.predict(data_test)
+    bag_predictions[tree_idx] = tree.predict(data_test)
     plt.plot(
         data_test["Feature"],
-        tree_predictions,
+        bag_predictions[tree_idx],
         linestyle="--",
         alpha=0.8,
         label=f"Tree #{tree_idx} predictions",
@@ -229,16 +229,15 @@ _ = plt.title("Predictions of trees trained on different bootstraps")
 # predicted values for the target variable. The final prediction of the ensemble
 # for the test data point is the average of those `n` values.
 #
-# We can plot the averaged predictions from the previous example.
+# We can plot the averaged predictions from the previous example, reusing the
+# predictions of each tree that we already computed.
 
 # %%
 sns.scatterplot(
     x=data_train["Feature"], y=target_train, color="black", alpha=0.5
 )
 
-bag_predictions = []
-for tree_idx, tree in enumerate(bag_of_trees):
-    tree_predictions = tree.predict(data_test)
+for tree_idx, tree_predictions in enumerate(bag_predictions):
     plt.plot(
         data_test["Feature"],
         tree_predictions,
@@ -246,12 +245,10 @@ for tree_idx, tree in enumerate(bag_of_trees):
         alpha=0.8,
         label=f"Tree #{tree_idx} predictions",
     )
-    bag_predictions.append(tree_predictions)
 
-bag_predictions = np.mean(bag_predictions, axis=0)
 plt.plot(
     data_test["Feature"],
-    bag_predictions,
+    bag_predictions.mean(axis=0),
     label="Averaged predictions",
     linestyle="-",
 )
@@ -282,6 +279,7 @@ from sklearn.ensemble import BaggingRegressor
 bagged_trees = BaggingRegressor(
     estimator=DecisionTreeRegressor(max_depth=3),
     n_estimators=100,
+    n_jobs=2,
 )
 _ = bagged_trees.fit(data_train, target_train)
 
@@ -381,6 +379,7 @@ polynomial_regressor = make_pipeline(
 bagging = BaggingRegressor(
     estimator=polynomial_regressor,
     n_estimators=100,
+    n_jobs=2,
     random_state=0,
 )
 _ = bagging.fit(data_train, target_train)
@@ -86,7 +86,7 @@ tree = make_pipeline(preprocessor, DecisionTreeClassifier(random_state=0))
 # %%
 from sklearn.model_selection import cross_val_score
 
-scores_tree = cross_val_score(tree, data, target)
+scores_tree = cross_val_score(tree, data, target, n_jobs=2)
 
 print(
     "Decision tree classifier: "
@@ -165,7 +165,7 @@ classifier.score(data_test, target_test)
 # %%
 from sklearn.metrics import ConfusionMatrixDisplay
 
-_ = ConfusionMatrixDisplay.from_estimator(classifier, data_test, target_test)
+_ = ConfusionMatrixDisplay.from_predictions(target_test, target_predicted)
 
 # %% [markdown]
 # The in-diagonal numbers are related to predictions that were correct while
@@ -278,8 +278,11 @@ target_proba_predicted = pd.DataFrame(
 )
 target_proba_predicted[:5]
 
+# %% [markdown]
+# We compare them with the predictions `target_predicted` computed earlier with
+# `classifier.predict`.
+
 # %%
-target_predicted = classifier.predict(data_test)
 target_predicted[:5]
 
 # %% [markdown]
@@ -299,13 +302,20 @@ np.all(equivalence_pred_proba)
 # and compute the same statistics presented earlier. Usually, the two metrics
 # recall and precision are computed and plotted on a graph. Each metric plotted
 # on a graph axis and each point on the graph corresponds to a specific decision
-# threshold. Let's start by computing the precision-recall curve.
+# threshold. Let's start by computing the precision-recall curve. Since we
+# already computed the predicted probabilities of the classifier, we pass the
+# ones of the positive class to `from_predictions` instead of letting the
+# display call `predict_proba` again.
 
 # %%
 from sklearn.metrics import PrecisionRecallDisplay
 
-disp = PrecisionRecallDisplay.from_estimator(
-    classifier, data_test, target_test, pos_label="donated", marker="+"
+pr_display = PrecisionRecallDisplay.from_predictions(
+    target_test,
+    target_proba_predicted["donated"],
+    pos_label="donated",
+    name="LogisticRegression",
+    marker="+",
 )
 disp = PrecisionRecallDisplay.from_estimator(
     dummy_classifier,
@@ -314,7 +324,7 @@ disp = PrecisionRecallDisplay.from_estimator(
     pos_label="donated",
     color="tab:orange",
     linestyle="--",
-    ax=disp.ax_,
+    ax=pr_display.ax_,
 )
 plt.xlabel("Recall (also known as TPR or sensitivity)")
 plt.ylabel("Precision (also known as PPV)")
@@ -347,7 +357,7 @@ _ = disp.ax_.set_title("Precision-recall curve")
 # of the positive class).
 
 # %%
-prevalence = target_test.value_counts()[1] / target_test.value_counts().sum()
+prevalence = target_test.value_counts(normalize=True)["donated"]
 print(f"Prevalence of the class 'donated': {prevalence:.2f}")
 
 # %% [markdown]
@@ -364,8 +374,12 @@ print(f"Prevalence of the class 'donated': {prevalence:.2f}")
 # %%
 from sklearn.metrics import RocCurveDisplay
 
-disp = RocCurveDisplay.from_estimator(
-    classifier, data_test, target_test, pos_label="donated", marker="+"
+roc_display = RocCurveDisplay.from_predictions(
+    target_test,
+    target_proba_predicted["donated"],
+    pos_label="donated",
+    name="LogisticRegression",
+    marker="+",
 )
 disp = RocCurveDisplay.from_estimator(
     dummy_classifier,
@@ -374,7 +388,7 @@ disp = RocCurveDisplay.from_estimator(
     pos_label="donated",
     color="tab:orange",
     linestyle="--",
-    ax=disp.ax_,
+    ax=roc_display.ax_,
 )
 plt.xlabel("False positive rate")
 plt.ylabel("True positive rate\n(also known as sensitivity or recall)")
@@ -394,30 +408,24 @@ _ = disp.ax_.set_title("Receiver Operating Characteristic curve")
 # performance obtained will be above this line.
 #
 # Instead of using a dummy classifier, you can use the parameter `plot_chance_level`
-# available in the ROC and PR displays:
+# available in the ROC and PR displays. The displays created above already
+# store the curves, so we can draw them again with their `plot` method without
+# recomputing them:
 
 # %%
 fig, axs = plt.subplots(ncols=2, nrows=1, figsize=(15, 7))
 
-PrecisionRecallDisplay.from_estimator(
-    classifier,
-    data_test,
-    target_test,
-    pos_label="donated",
+pr_display.plot(
+    ax=axs[0],
     marker="+",
     plot_chance_level=True,
     chance_level_kw={"color": "tab:orange", "linestyle": "--"},
-    ax=axs[0],
 )
-RocCurveDisplay.from_estimator(
-    classifier,
-    data_test,
-    target_test,
-    pos_label="donated",
+roc_display.plot(
+    ax=axs[1],
     marker="+",
     plot_chance_level=True,
     chance_level_kw={"color": "tab:orange", "linestyle": "--"},
-    ax=axs[1],
 )
 
 _ = fig.suptitle("PR and ROC curves")
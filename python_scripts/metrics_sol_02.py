@@ -47,9 +47,10 @@ model = LinearRegression()
 
 # %%
 # solution
-from sklearn.model_selection import cross_val_score
+from sklearn.model_selection import cross_val_score, KFold
 
-scores = cross_val_score(model, data, target, cv=10, scoring="r2")
+cv = KFold(n_splits=10)
+scores = cross_val_score(model, data, target, cv=cv, scoring="r2", n_jobs=2)
 print(f"R2 score: {scores.mean():.3f} ± {scores.std():.3f}")
 
 # %% [markdown]
@@ -59,7 +60,7 @@ print(f"R2 score: {scores.mean():.3f} ± {scores.std():.3f}")
 # %%
 # solution
 scores = cross_val_score(
-    model, data, target, cv=10, scoring="neg_mean_absolute_error"
+    model, data, target, cv=cv, scoring="neg_mean_absolute_error", n_jobs=2
 )
 errors = -scores
 print(f"Mean absolute error: {errors.mean():.3f} k$ ± {errors.std():.3f}")
@@ -80,7 +81,9 @@ print(f"Mean absolute error: {errors.mean():.3f} k$ ± {errors.std():.3f}")
 from sklearn.model_selection import cross_validate
 
 scoring = ["r2", "neg_mean_absolute_error"]
-cv_results = cross_validate(model, data, target, scoring=scoring)
+cv_results = cross_validate(
+    model, data, target, cv=cv, scoring=scoring, n_jobs=2
+)
 
 # %% tags=["solution"]
 import pandas as pd
@@ -113,7 +116,7 @@ scores = defaultdict(list)
 
 for loss_func in loss_functions:
     model = HistGradientBoostingRegressor(loss=loss_func)
-    cv_results = cross_validate(model, data, target, scoring=scoring)
+    cv_results = cross_validate(model, data, target, scoring=scoring, n_jobs=2)
     mse = -cv_results["test_neg_mean_squared_error"]
     mae = -cv_results["test_neg_mean_absolute_error"]
     scores["loss"].append(loss_func)